@@ -2,6 +2,7 @@
 import os
 import urllib.parse
 import datetime
+import struct
 
 from gi.repository import GObject, Nemo, Gtk, Gdk
 
@@ -11,22 +12,24 @@ ATTR_READABLE = "user.ntfs_crtime_readable"
 
 # FILETIME epoch
 FILETIME_EPOCH = datetime.datetime(1601, 1, 1, tzinfo=datetime.timezone.utc)
-FILETIME_TICKS_PER_SECOND = 10_000_000  # 100ns units per second
+FILETIME_TICKS_PER_MICROSECOND = 10  # 100ns units per microsecond
+FILETIME_STRUCT = struct.Struct("<Q")  # little-endian unsigned 64-bit
 
 
 def filetime_to_datetime(filetime: int) -> datetime.datetime:
-    seconds, remainder = divmod(filetime, FILETIME_TICKS_PER_SECOND)
-    microseconds = remainder // 10
-    return FILETIME_EPOCH + datetime.timedelta(seconds=seconds,
-                                               microseconds=microseconds)
+    microseconds = filetime // FILETIME_TICKS_PER_MICROSECOND
+    return FILETIME_EPOCH + datetime.timedelta(microseconds=microseconds)
 
 
 def format_timestamp_local(dt_utc: datetime.datetime) -> str:
     """
     Format as: YYYY-MM-DD HH:MM:SS (ISO 8601, sorts chronologically)
     """
+    # astimezone() with no argument applies the DST rules of the date itself.
+    # isoformat() is the same layout as strftime("%Y-%m-%d %H:%M:%S") up to the
+    # UTC offset suffix, without strftime's locale handling
     dt_local = dt_utc.astimezone()
-    return dt_local.strftime("%Y-%m-%d %H:%M:%S")
+    return dt_local.isoformat(" ", "seconds")[:19]
 
 
 def get_ntfs_crtime_string(path: str) -> str:
@@ -40,9 +43,10 @@ def get_ntfs_crtime_string(path: str) -> str:
 
     # 8 bytes: FILETIME
     if len(raw) == 8:
-        filetime_int = int.from_bytes(raw, "little", signed=False)
+        filetime_int, = FILETIME_STRUCT.unpack(raw)
         dt = filetime_to_datetime(filetime_int)
         return format_timestamp_local(dt)
+    return ""
 
 
 class NTFSCRTimeExtension(GObject.GObject,
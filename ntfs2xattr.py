@@ -3,16 +3,59 @@ import os
 import argparse
 import datetime
 import sys
+import errno
+import fcntl
+import stat
+import struct
 import shutil
+import time
 import logging
-from typing import List, Optional, Tuple
+import logging.handlers
+import queue
+import atexit
+import contextlib
+import functools
+import concurrent.futures
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 NTFS_CRTIME_ATTR_SRC = "system.ntfs_crtime"   # from NTFS
 NTFS_CRTIME_ATTR_DST = "user.ntfs_crtime"     # raw FILETIME bytes
 NTFS_CRTIME_ATTR_READABLE = "user.ntfs_crtime_readable"  # readable string
 
 FILETIME_EPOCH = datetime.datetime(1601, 1, 1, tzinfo=datetime.timezone.utc)
-FILETIME_TICKS_PER_SECOND = 10_000_000  # 100ns units per second
+FILETIME_TICKS_PER_MICROSECOND = 10  # 100ns units per microsecond
+FILETIME_STRUCT = struct.Struct("<Q")  # little-endian unsigned 64-bit
+# Files that were copied, extracted or installed together often share a
+# creation time, so conversions are cached per distinct timestamp
+CRTIME_CACHE_SIZE = 65536
+
+# Files are copied concurrently; almost all the time is spent blocked in
+# syscalls, which release the GIL
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+COPY_WINDOW = 4096  # files queued for the workers at any one time
+
+PROGRESS_REDRAW_INTERVAL = 0.05       # seconds
+TERMINAL_SIZE_REFRESH_INTERVAL = 5.0  # seconds
+
+# How each file's data gets to the destination:
+#   copy      copy the data
+#   reflink   share the data blocks copy-on-write (btrfs, xfs, bcachefs),
+#             copying instead where the filesystems can't
+#   hardlink  link the source inode itself, so the xattrs land on the source
+#             files too; source and destination must be on one filesystem
+COPY_MODES = ("copy", "reflink", "hardlink")
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)  # fcntl.FICLONE is Python 3.12+
+
+COPY_CHUNK_SIZE = 1 << 20
+# errnos meaning "this copy method isn't available here", not a failed copy
+COPY_FALLBACK_ERRNOS = (errno.EXDEV, errno.EINVAL, errno.ENOSYS,
+                        errno.EOPNOTSUPP, errno.EBADF)
+# errnos tolerated when copying the source's own xattrs (as shutil.copystat)
+XATTR_IGNORED_ERRNOS = (errno.EPERM, errno.ENOTSUP, errno.ENODATA, errno.EINVAL)
+# Copies are written to an anonymous O_TMPFILE and linked into place once
+# complete, naming the open file through /proc/self/fd
+PROC_SELF_FD = "/proc/self/fd"
+CAN_LINK_TMPFILE = hasattr(os, "O_TMPFILE") and os.path.isdir(PROC_SELF_FD)
 
 # ANSI colors
 YELLOW = "\033[33m"
@@ -22,19 +65,23 @@ RED    = "\033[31m"
 RESET  = "\033[0m"
 
 
+@functools.lru_cache(maxsize=CRTIME_CACHE_SIZE)
 def filetime_to_datetime(filetime: int) -> datetime.datetime:
-    seconds, remainder = divmod(filetime, FILETIME_TICKS_PER_SECOND)
-    microseconds = remainder // 10
-    return FILETIME_EPOCH + datetime.timedelta(seconds=seconds,
-                                               microseconds=microseconds)
+    microseconds = filetime // FILETIME_TICKS_PER_MICROSECOND
+    return FILETIME_EPOCH + datetime.timedelta(microseconds=microseconds)
 
 
+@functools.lru_cache(maxsize=CRTIME_CACHE_SIZE)
 def format_timestamp_local(dt_utc: datetime.datetime) -> str:
     """
     Format as: YYYY-MM-DD HH:MM:SS (ISO 8601, sorts chronologically)
     """
+    # astimezone() with no argument applies the DST rules of the date itself,
+    # which a cached local tzinfo (a fixed UTC offset) would not.
+    # isoformat() is the same layout as strftime("%Y-%m-%d %H:%M:%S") up to the
+    # UTC offset suffix, and much cheaper than strftime
     dt_local = dt_utc.astimezone()
-    return dt_local.strftime("%Y-%m-%d %H:%M:%S")
+    return dt_local.isoformat(" ", "seconds")[:19]
 
 
 def get_ntfs_crtime_with_raw(path: str) -> Tuple[Optional[datetime.datetime],
@@ -54,7 +101,7 @@ def get_ntfs_crtime_with_raw(path: str) -> Tuple[Optional[datetime.datetime],
 
     if len(raw) == 8:
         raw_hex_str = "0x" + raw.hex()
-        filetime_int = int.from_bytes(raw, "little", signed=False)
+        filetime_int, = FILETIME_STRUCT.unpack(raw)
         dt = filetime_to_datetime(filetime_int)
     else:
         try:
@@ -67,7 +114,7 @@ def get_ntfs_crtime_with_raw(path: str) -> Tuple[Optional[datetime.datetime],
                 raw_hex_str = "0x" + hex_part.lower()
             filetime_int = int(hex_part, 16)
             dt = filetime_to_datetime(filetime_int)
-            raw_bytes = int(filetime_int).to_bytes(8, "little", signed=False)
+            raw_bytes = FILETIME_STRUCT.pack(filetime_int)
         except Exception:
             try:
                 raw_hex_str = text
@@ -78,19 +125,256 @@ def get_ntfs_crtime_with_raw(path: str) -> Tuple[Optional[datetime.datetime],
     return dt, raw_hex_str, raw_bytes
 
 
-def build_file_list(input_dir: str) -> List[str]:
-    files: List[str] = []
+@functools.lru_cache(maxsize=None)
+def proc_self_fd_dir() -> int:
+    """
+    Directory fd for /proc/self/fd. Linking relative to it makes os.link use
+    linkat() with AT_SYMLINK_FOLLOW, which is what links an O_TMPFILE into place.
+    """
+    return os.open(PROC_SELF_FD, os.O_RDONLY | os.O_DIRECTORY)
+
+
+def copy_file_contents(src_fd: int, dst_fd: int) -> None:
+    """
+    Copy the data from src_fd to dst_fd, keeping it in the kernel where possible:
+    copy_file_range() within a filesystem, sendfile() across filesystems (e.g.
+    NTFS to ext4), and a plain read/write loop for anything supporting neither.
+    """
+    def sendfile(in_fd: int, out_fd: int, count: int) -> int:
+        return os.sendfile(out_fd, in_fd, None, count)
+
+    for copy_chunk in (os.copy_file_range, sendfile):
+        try:
+            while copy_chunk(src_fd, dst_fd, COPY_CHUNK_SIZE):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in COPY_FALLBACK_ERRNOS:
+                raise
+
+    while True:
+        buf = memoryview(os.read(src_fd, COPY_CHUNK_SIZE))
+        if not buf:
+            return
+        while buf:
+            buf = buf[os.write(dst_fd, buf):]
+
+
+def copy_xattrs(src_fd: int, dst_fd: int) -> None:
+    """
+    Copy the source file's own extended attributes, as shutil.copy2 would.
+    """
+    try:
+        names = os.listxattr(src_fd)
+    except OSError as e:
+        if e.errno not in XATTR_IGNORED_ERRNOS:
+            raise
+        return
+    for name in names:
+        try:
+            os.setxattr(dst_fd, name, os.getxattr(src_fd, name))
+        except OSError as e:
+            if e.errno not in XATTR_IGNORED_ERRNOS:
+                raise
+
+
+def copy_file_with_xattrs(src_path: str, dst_path: str,
+                          xattrs: Dict[str, bytes], mode: str) -> Optional[OSError]:
+    """
+    Copy src_path to dst_path with its data, permissions, timestamps and xattrs
+    (like shutil.copy2), then add the given xattrs, all through a single pair of
+    file descriptors. The copy only appears at dst_path once it is complete.
+    mode is one of COPY_MODES.
+
+    Raises if the copy fails; a failure to add the xattrs doesn't stop the copy
+    and is returned instead.
+    """
+    xattr_error: Optional[OSError] = None
+    if mode == "hardlink":
+        os.link(src_path, dst_path)
+        if not xattrs:
+            return None
+        # User xattrs can't be set on a read-only file, so give an owned one
+        # u+w for the duration and put its mode back afterwards
+        st = os.stat(dst_path)
+        restore_mode: Optional[int] = None
+        if not st.st_mode & stat.S_IWUSR and st.st_uid == os.geteuid():
+            restore_mode = stat.S_IMODE(st.st_mode)
+        try:
+            if restore_mode is not None:
+                os.chmod(dst_path, restore_mode | stat.S_IWUSR)
+            for name, value in xattrs.items():
+                os.setxattr(dst_path, name, value)
+        except OSError as e:
+            xattr_error = e
+        finally:
+            if restore_mode is not None:
+                os.chmod(dst_path, restore_mode)
+        return xattr_error
+
+    # O_NONBLOCK so that opening a FIFO doesn't wait for a writer
+    src_fd = os.open(src_path, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        src_stat = os.fstat(src_fd)
+        # Special files fail like shutil.copyfile; only regular files are copied
+        if stat.S_ISFIFO(src_stat.st_mode):
+            raise shutil.SpecialFileError(f"'{src_path}' is a named pipe")
+        if not stat.S_ISREG(src_stat.st_mode):
+            raise shutil.SpecialFileError(f"'{src_path}' is not a regular file")
+        os.set_blocking(src_fd, True)
+        anonymous = CAN_LINK_TMPFILE
+        if anonymous:
+            try:
+                dst_fd = os.open(os.path.dirname(dst_path),
+                                 os.O_TMPFILE | os.O_WRONLY, 0o600)
+            except OSError as e:
+                if e.errno not in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+                    raise
+                anonymous = False
+        if not anonymous:
+            dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            cloned = False
+            if mode == "reflink":
+                try:
+                    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                    cloned = True
+                except OSError as e:
+                    if e.errno not in COPY_FALLBACK_ERRNOS + (errno.ENOTTY,):
+                        raise
+            if not cloned:
+                copy_file_contents(src_fd, dst_fd)
+            copy_xattrs(src_fd, dst_fd)
+            try:
+                for name, value in xattrs.items():
+                    os.setxattr(dst_fd, name, value)
+            except OSError as e:
+                xattr_error = e
+            # Permissions last: user xattrs can't be set once the file is read-only
+            os.fchmod(dst_fd, stat.S_IMODE(src_stat.st_mode))
+            os.utime(dst_fd, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            if anonymous:
+                os.link(str(dst_fd), dst_path, src_dir_fd=proc_self_fd_dir())
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    return xattr_error
+
+
+class CopyResult(NamedTuple):
+    src_path: str
+    dst_path: str
+    rel_path: str
+    has_crtime: bool
+    raw_ts: str       # raw timestamp for the log, or "N/A"
+    readable_ts: str  # readable timestamp, or "N/A"
+    xattr_error: Optional[OSError]   # file copied but xattrs not set
+    copy_error: Optional[Exception]  # file not copied
+
+
+def copy_one(src_path: str, src_dir: str, dest_dir: str,
+             with_readable: bool, mode: str) -> CopyResult:
+    """
+    Read the NTFS crtime of src_path and copy it to the same relative path under
+    dest_dir with the crtime xattr added (and the readable one, if with_readable).
+    Runs on the worker threads, so instead of logging or printing it reports
+    everything in the result.
+    """
+    rel = os.path.relpath(src_path, src_dir)
+    dst_path = os.path.join(dest_dir, rel)
+    dt, raw_hex, raw_bytes = get_ntfs_crtime_with_raw(src_path)
+    readable_ts = format_timestamp_local(dt) if dt else "N/A"
+    xattr_error: Optional[OSError] = None
+    copy_error: Optional[Exception] = None
+    try:
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        xattrs: Dict[str, bytes] = {}
+        if raw_bytes:
+            xattrs[NTFS_CRTIME_ATTR_DST] = raw_bytes
+            if with_readable:
+                xattrs[NTFS_CRTIME_ATTR_READABLE] = readable_ts.encode("utf-8")
+        xattr_error = copy_file_with_xattrs(src_path, dst_path, xattrs, mode)
+    except Exception as e:
+        copy_error = e
+    return CopyResult(src_path, dst_path, rel, dt is not None, raw_hex or "N/A",
+                      readable_ts, xattr_error, copy_error)
+
+
+def copy_all(src_paths: Iterable[str], src_dir: str, dest_dir: str,
+             with_readable: bool, mode: str) -> Iterator[CopyResult]:
+    """
+    Run copy_one for every path on a thread pool, yielding results as they
+    complete. At most COPY_WINDOW files are queued at a time, so src_paths is
+    consumed lazily and memory use doesn't grow with the size of the tree.
+    """
+    pool = concurrent.futures.ThreadPoolExecutor(COPY_WORKERS)
+    # Finished futures are handed over by their done-callbacks, so collecting
+    # a result is O(1) rather than a wait() over the whole window
+    finished: queue.SimpleQueue = queue.SimpleQueue()
+    in_flight = 0
+    try:
+        for src_path in src_paths:
+            if in_flight >= COPY_WINDOW:
+                in_flight -= 1
+                yield finished.get().result()
+            future = pool.submit(copy_one, src_path, src_dir, dest_dir,
+                                 with_readable, mode)
+            future.add_done_callback(finished.put)
+            in_flight += 1
+            # Pass on whatever else has finished, so progress keeps up with a
+            # slow walk
+            while in_flight and not finished.empty():
+                in_flight -= 1
+                yield finished.get().result()
+        while in_flight:
+            in_flight -= 1
+            yield finished.get().result()
+    finally:
+        # On Ctrl-C (or any early exit) only wait for the files already being
+        # copied, not the whole queue
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_files(input_dir: str, exclude_dir: Optional[str] = None) -> Iterator[str]:
+    """
+    Yield the path of every file under input_dir, skipping the exclude_dir subtree.
+    """
+    stack = [input_dir]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                # Same classification as os.walk: symlinks to directories are
+                # neither followed nor treated as files
+                if entry.is_dir():
+                    if not entry.is_symlink() and entry.path != exclude_dir:
+                        subdirs.append(entry.path)
+                    continue
+                yield entry.path
+        # Reversed so that subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+def count_files(input_dir: str, msg_prefix: str,
+                exclude_dir: Optional[str] = None) -> int:
+    """
+    Count the files under input_dir, showing a running count after msg_prefix.
+    """
     count = 0
-    for root, _, fnames in os.walk(input_dir):
-        for name in fnames:
-            files.append(os.path.join(root, name))
-            count += 1
-            sys.stdout.write(
-                f"\r\033[2K{YELLOW}Building file list... {WHITE}{count}{RESET}"
-            )
+    last_redraw = float("-inf")
+    for _ in iter_files(input_dir, exclude_dir):
+        count += 1
+        now = time.monotonic()
+        if now - last_redraw >= PROGRESS_REDRAW_INTERVAL:
+            last_redraw = now
+            sys.stdout.write(f"\r\033[2K{msg_prefix}{count}{RESET}")
             sys.stdout.flush()
-    sys.stdout.write("\n")
-    return files
+    return count
 
 
 def truncate_filename(rel_path: str, term_width: int, ts_str: str) -> str:
@@ -107,38 +391,94 @@ def truncate_filename(rel_path: str, term_width: int, ts_str: str) -> str:
     return "..." + rel_path[-tail_len:]
 
 
-def update_progress(i: int, total: int, rel_path: str, ts_str: Optional[str]) -> None:
-    try:
-        width = shutil.get_terminal_size().columns
-    except Exception:
-        width = 80
-
-    if i > 0:
-        sys.stdout.write("\r\033[2K")
-    if ts_str is not None and rel_path:
-        display_name = truncate_filename(rel_path, width, ts_str)
-        print(f"'{display_name}'  {YELLOW}{ts_str}{RESET}")
+class ProgressBar:
+    """
+    Progress bar at the bottom of the terminal, with the copied files scrolling
+    past above it. Lines are buffered and the screen is redrawn at most every
+    PROGRESS_REDRAW_INTERVAL seconds, in a single write. When stdout isn't a
+    terminal only the lines are written. Without a total, a running count of
+    files is shown instead of the bar.
+    """
 
-    bar_width = max(10, width - 10)
-    progress = min(1.0, (i + 1) / total)
-    filled = int(bar_width * progress)
-    bar = "#" * filled + " " * (bar_width - filled)
-    percent = int(progress * 100)
-    sys.stdout.write(f"[{GREEN}{bar}{RESET}] {percent:3d}%")
-    sys.stdout.flush()
+    def __init__(self, total: Optional[int]):
+        self.total = total
+        self.isatty = sys.stdout.isatty()
+        self.done = 0
+        self.lines: List[str] = []
+        self.last_redraw = float("-inf")
+        self.last_drawn = (-1, -1)  # (filled, percent) at last redraw
+        self.width = 0
+        self.width_checked = float("-inf")
+        self.terminal_width(time.monotonic())
+
+    def terminal_width(self, now: float) -> int:
+        # get_terminal_size() is an ioctl, so only re-check it every so often
+        if now - self.width_checked >= TERMINAL_SIZE_REFRESH_INTERVAL:
+            self.width_checked = now
+            try:
+                width = shutil.get_terminal_size().columns
+            except Exception:
+                width = 80
+            if width != self.width:
+                # Everything derived from the width only changes with it
+                self.width = width
+                self.bar_width = max(10, width - 10)
+                self.bar_done = "#" * self.bar_width
+                self.bar_todo = " " * self.bar_width
+        return self.width
+
+    def print_line(self, line: str) -> None:
+        if self.isatty:
+            self.lines.append(line + "\n")
+        else:
+            sys.stdout.write(line + "\n")
+
+    def update(self, i: int, rel_path: str, ts_str: Optional[str]) -> None:
+        """
+        Record that file i has been processed, listing it if ts_str is given.
+        """
+        self.done = i + 1
+        now = time.monotonic()
+        if ts_str is not None and rel_path:
+            display_name = truncate_filename(rel_path, self.terminal_width(now), ts_str)
+            self.print_line(f"'{display_name}'  {YELLOW}{ts_str}{RESET}")
+        if self.isatty and now - self.last_redraw >= PROGRESS_REDRAW_INTERVAL:
+            self.redraw(now)
+
+    def redraw(self, now: float) -> None:
+        self.terminal_width(now)
+        if self.total is None:
+            filled, percent = self.done, -1
+        else:
+            progress = min(1.0, self.done / self.total)
+            filled = int(self.bar_width * progress)
+            percent = int(progress * 100)
+        if not self.lines and (filled, percent) == self.last_drawn:
+            return
+        self.last_redraw = now
+        self.last_drawn = (filled, percent)
+        lines = "".join(self.lines)
+        self.lines.clear()
+        if self.total is None:
+            status = f"{GREEN}{self.done}{RESET} files processed"
+        else:
+            status = (f"[{GREEN}{self.bar_done[:filled]}{self.bar_todo[filled:]}"
+                      f"{RESET}] {percent:3d}%")
+        sys.stdout.write(f"\r\033[2K{lines}{status}")
+        sys.stdout.flush()
+
+    def finish(self) -> None:
+        if self.isatty:
+            self.redraw(time.monotonic())
+            sys.stdout.write("\n")
 
 
 def verify_target_count(dest_dir: str, expected_count: int,
                         logger: Optional[logging.Logger], do_verify: bool) -> None:
     if not do_verify:
         return
-    count = 0
     msg_prefix = "Verifying target directory file count... "
-    for root, _, fnames in os.walk(dest_dir):
-        for _ in fnames:
-            count += 1
-            sys.stdout.write(f"\r\033[2K{msg_prefix}{count}")
-            sys.stdout.flush()
+    count = count_files(dest_dir, msg_prefix)
 
     if count == expected_count:
         sys.stdout.write(f"\r{msg_prefix}{count} ✅\n")
@@ -177,7 +517,14 @@ def setup_logger(script_name: str, enabled: bool) -> Optional[logging.Logger]:
     handler = logging.FileHandler(log_filename, "w", "utf-8")
     handler.setLevel(logging.INFO)
     handler.setFormatter(logging.Formatter("[%(asctime)s - %(levelname)s] %(message)s"))
-    logger.addHandler(handler)
+
+    # Records are formatted and written to the file on a background thread, so
+    # the per-file log lines don't hold up the copy loop
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)  # flushes anything still queued
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     cmdline = " ".join(sys.argv)
     logger.info(f"Command: {cmdline}")
@@ -186,17 +533,26 @@ def setup_logger(script_name: str, enabled: bool) -> Optional[logging.Logger]:
 
 
 def walk_and_copy(src_dir: str, dest_dir: str,
-                  logger: Optional[logging.Logger], verify: bool) -> None:
+                  logger: Optional[logging.Logger], verify: bool,
+                  with_readable: bool, mode: str) -> None:
     src_dir, dest_dir = map(os.path.abspath, (src_dir, dest_dir))
     os.makedirs(dest_dir, exist_ok=True)
-    files = build_file_list(src_dir)
-    total = len(files)
-    if logger:
-        logger.info(f"{total} files found in source '{src_dir}'")
-    if not total:
-        print("No files found.")
-        verify_target_count(dest_dir, 0, logger, verify)
-        return
+    # Files are streamed to the copy workers as the walk finds them. Only when
+    # verifying is the source counted first, so that the count to verify
+    # against and the progress bar's total are known; otherwise the progress
+    # is an open-ended count and the source is walked just once.
+    # dest_dir is excluded in case it lies inside src_dir
+    total: Optional[int] = None
+    if verify:
+        msg_prefix = f"{YELLOW}Building file list... {WHITE}"
+        total = count_files(src_dir, msg_prefix, dest_dir)
+        sys.stdout.write(f"\r\033[2K{msg_prefix}{total}{RESET}\n")
+        if logger:
+            logger.info(f"{total} files found in source '{src_dir}'")
+        if not total:
+            print("No files found.")
+            verify_target_count(dest_dir, 0, logger, verify)
+            return
 
     print(f"{YELLOW}Extracting NTFS creation times{RESET}")
 
@@ -204,42 +560,48 @@ def walk_and_copy(src_dir: str, dest_dir: str,
     copy_failures = []  # List of (rel_path, error_message)
     xattr_failures = []  # List of rel_path that copied but failed xattr
 
-    for i, src_path in enumerate(files):
-        rel = os.path.relpath(src_path, src_dir)
-        dst_path = os.path.join(dest_dir, rel)
-        dt, raw_hex, raw_bytes = get_ntfs_crtime_with_raw(src_path)
-        if dt is None and logger:
-            logger.warning(f"'{src_path}': no NTFS creation time found")
-        readable_ts = format_timestamp_local(dt) if dt else "N/A"
-        raw_ts_for_log = raw_hex or "N/A"
-        try:
-            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-            shutil.copy2(src_path, dst_path)
-            # Add xattrs
-            if raw_bytes:
-                try:
-                    os.setxattr(dst_path, NTFS_CRTIME_ATTR_DST, raw_bytes)
-                    os.setxattr(dst_path, NTFS_CRTIME_ATTR_READABLE,
-                                readable_ts.encode("utf-8"))
-                except OSError as e:
-                    xattr_failures.append(rel)
-                    if logger:
-                        logger.error(
-                            f"'{dst_path}': failed to set xattr: {e}")
+    progress = ProgressBar(total)
+    processed = 0
+    src_paths = iter_files(src_dir, dest_dir)
+    results = copy_all(src_paths, src_dir, dest_dir, with_readable, mode)
+    # closing() so the pool is shut down even if the loop body is interrupted
+    with contextlib.closing(results):
+        for result in results:
+            i = processed
+            processed += 1
+            rel = result.rel_path
+            if not result.has_crtime and logger:
+                logger.warning(f"'{result.src_path}': no NTFS creation time found")
+            if result.copy_error is not None:
+                e = result.copy_error
+                copy_failures.append((rel, str(e)))
+                progress.print_line(
+                    f"{WHITE}'{rel}'{RESET}{RED} failed to copy: {RESET}{WHITE}{e}{RESET}")
+                if logger:
+                    logger.error(f"'{result.src_path}' failed to copy: {e}")
+                progress.update(i, "", None)
+                continue
+            if result.xattr_error is not None:
+                xattr_failures.append(rel)
+                if logger:
+                    logger.error(
+                        f"'{result.dst_path}': failed to set xattr: {result.xattr_error}")
             if logger:
                 logger.info(
-                    f"'{src_path}' --> '{dst_path}'  "
-                    f"with timestamp {raw_ts_for_log} ({readable_ts})")
-            update_progress(i, total, rel, readable_ts)
-        except Exception as e:
-            copy_failures.append((rel, str(e)))
-            print(f"{WHITE}'{rel}'{RESET}{RED} failed to copy: {RESET}{WHITE}{e}{RESET}")
-            if logger:
-                logger.error(f"'{src_path}' failed to copy: {e}")
-            update_progress(i, total, "", None)
+                    f"'{result.src_path}' --> '{result.dst_path}'  "
+                    f"with timestamp {result.raw_ts} ({result.readable_ts})")
+            progress.update(i, rel, result.readable_ts)
 
-    sys.stdout.write("\n")
-    verify_target_count(dest_dir, total, logger, verify)
+    progress.finish()
+    if total is None:
+        if logger:
+            logger.info(f"{processed} files found in source '{src_dir}'")
+        if not processed:
+            print("No files found.")
+    elif processed != total and logger:
+        logger.warning(
+            f"{processed} files processed (source changed since it was counted)")
+    verify_target_count(dest_dir, processed, logger, verify)
 
     # Print error summary
     if copy_failures:
@@ -260,6 +622,11 @@ def main():
     parser.add_argument("--no-log", action="store_true", help="Disable logging")
     parser.add_argument("--no-verify", action="store_true",
                         help="Disable verification of file count")
+    parser.add_argument("--with-readable", action="store_true",
+                        help=f"Also add the {NTFS_CRTIME_ATTR_READABLE} xattr")
+    parser.add_argument("--mode", choices=COPY_MODES, default="copy",
+                        help="Copy file data (default), reflink it, or hardlink "
+                             "the source files (which adds the xattrs to them too)")
     args = parser.parse_args()
 
     if not os.path.isdir(args.src):
@@ -268,9 +635,18 @@ def main():
     if os.path.exists(args.dest):
         sys.exit(f"'{args.dest}' directory already exists. Please specify an empty directory.")
 
+    if args.mode == "hardlink":
+        # dest doesn't exist yet, so check the nearest directory that does
+        dest_parent = os.path.dirname(os.path.abspath(args.dest))
+        while not os.path.exists(dest_parent):
+            dest_parent = os.path.dirname(dest_parent)
+        if os.stat(dest_parent).st_dev != os.stat(args.src).st_dev:
+            sys.exit("Error: --mode=hardlink needs --src and --dest on the same filesystem")
+
     script_name = os.path.basename(sys.argv[0]) or "script"
     logger = setup_logger(script_name, not args.no_log)
-    walk_and_copy(args.src, args.dest, logger, not args.no_verify)
+    walk_and_copy(args.src, args.dest, logger, not args.no_verify,
+                  args.with_readable, args.mode)
 
 
 if __name__ == "__main__":